@@ -34,7 +34,7 @@ class ApiNd:
     """
 
     def __init__(self):
-        self.class_name = self.__class__.__name__
+        self.class_name = type(self).__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
         self.conversion = ConversionUtils()
         # Popuate in subclasses to indicate which properties
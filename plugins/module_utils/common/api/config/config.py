@@ -17,8 +17,6 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 __author__ = "Allen Robel"
 
-import logging
-
 from ..api_nd import ApiNd
 
 
@@ -35,7 +33,5 @@ class Config(ApiNd):
 
     def __init__(self):
         super().__init__()
-        self.class_name = self.__class__.__name__
-        self.log = logging.getLogger(f"dcnm.{self.class_name}")
         self.log.debug("ENTERED api.config.Config()")
         self.config = f"{self.api}/config"
@@ -17,8 +17,6 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 __author__ = "Allen Robel"
 
-import logging
-
 from ..config import Config
 
 
@@ -35,20 +33,11 @@ class Federation(Config):
 
     def __init__(self):
         super().__init__()
-        self.class_name = self.__class__.__name__
-        self.log = logging.getLogger(f"dcnm.{self.class_name}")
-        self.log.debug("ENTERED api.config.Federation()")
         self.federation = f"{self.config}/federation"
 
 
 class EpFederationMembers(Federation):
     def __init__(self):
         super().__init__()
-        self.class_name = self.__class__.__name__
-        self.log = logging.getLogger(f"dcnm.{self.class_name}")
-
         self._verb = "GET"
         self._path = f"{self.federation}/members"
-        msg = "ENTERED api.config.federation."
-        msg += f"Federation.{self.class_name}"
-        self.log.debug(msg)
@@ -17,8 +17,6 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 __author__ = "Allen Robel"
 
-import logging
-
 from ansible_collections.cisco.dcnm.plugins.module_utils.common.api.config.federation.federation import \
     Federation
 
@@ -36,8 +34,6 @@ class Manager(Federation):
 
     def __init__(self):
         super().__init__()
-        self.class_name = self.__class__.__name__
-        self.log = logging.getLogger(f"dcnm.{self.class_name}")
         self.log.debug("ENTERED api.config.federation.manager.Manager()")
         self.manager = f"{self.federation}/manager"
 
@@ -54,12 +50,8 @@ class EpFederationManagerGet(Manager):
     """
     def __init__(self):
         super().__init__()
-        self.class_name = self.__class__.__name__
-        self.log = logging.getLogger(f"dcnm.{self.class_name}")
-
         self._verb = "GET"
         self._path = f"{self.manager}/mo"
-
-        msg = "ENTERED api.config.federation.manager."
-        msg += f"Manager.{self.class_name}"
-        self.log.debug(msg)
+        self.log.debug(
+            "ENTERED api.config.federation.manager.Manager.%s", self.class_name
+        )
@@ -270,36 +270,22 @@ class MaintenanceModeInfo:
             except ValueError as error:
                 raise ValueError(error) from error
 
-            fabric_read_only = self.fabric_details.is_read_only
-
-            info[ip_address] = {}
-            info[ip_address].update({"fabric_name": fabric_name})
-            info[ip_address].update({"ip_address": ip_address})
-
-            if freeze_mode is True:
-                info[ip_address].update({"fabric_freeze_mode": True})
-            else:
-                info[ip_address].update({"fabric_freeze_mode": False})
-
-            if fabric_read_only is True:
-                info[ip_address].update({"fabric_read_only": True})
-            else:
-                info[ip_address].update({"fabric_read_only": False})
-
-            if freeze_mode is True or fabric_read_only is True:
-                info[ip_address].update({"fabric_deployment_disabled": True})
-            else:
-                info[ip_address].update({"fabric_deployment_disabled": False})
-
-            info[ip_address].update({"mode": mode})
-
-            if role is not None:
-                info[ip_address].update({"role": role})
-            else:
-                info[ip_address].update({"role": "na"})
-            info[ip_address].update({"serial_number": serial_number})
+            fabric_freeze_mode = freeze_mode is True
+            fabric_read_only = self.fabric_details.is_read_only is True
+            fabric_deployment_disabled = fabric_freeze_mode or fabric_read_only
+
+            info[ip_address] = {
+                "fabric_name": fabric_name,
+                "ip_address": ip_address,
+                "fabric_freeze_mode": fabric_freeze_mode,
+                "fabric_read_only": fabric_read_only,
+                "fabric_deployment_disabled": fabric_deployment_disabled,
+                "mode": mode,
+                "role": role if role is not None else "na",
+                "serial_number": serial_number,
+            }
 
-        self.info = copy.deepcopy(info)
+        self.info = info
 
     def _get(self, item):
         """
@@ -313,7 +299,7 @@ class MaintenanceModeInfo:
         -   We do not need to check that ``item`` exists in the filtered
             switch dict, since ``refresh()`` has already done so.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_get"
 
         if self.filter is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -91,19 +91,28 @@ class MergeDicts:
 
     def merge_dicts(self, dict1: dict, dict2: dict) -> dict:
         """
-        Merge dict2 into dict1 and return dict1.
+        Merge dict2 into dict1 and return a copy of dict1.
         Keys in dict2 have precedence over keys in dict1.
         """
+        self._merge_dicts_in_place(dict1, dict2)
+        return copy.deepcopy(dict1)
+
+    def _merge_dicts_in_place(self, dict1: dict, dict2: dict) -> None:
+        """
+        Recursively merge dict2 into dict1, modifying dict1 in place.
+
+        Nested dicts are merged without copying, so that the caller
+        copies the result only once, after the merge completes.
+        """
         for key in dict2:
             if (
                 key in dict1
                 and isinstance(dict1[key], Map)
                 and isinstance(dict2[key], Map)
             ):
-                self.merge_dicts(dict1[key], dict2[key])
+                self._merge_dicts_in_place(dict1[key], dict2[key])
             else:
                 dict1[key] = dict2[key]
-        return copy.deepcopy(dict1)
 
     @property
     def dict_merged(self):
@@ -19,7 +19,6 @@ __copyright__ = "Copyright (c) 2024 Cisco and/or its affiliates."
 __author__ = "Allen Robel"
 
 import copy
-import inspect
 import logging
 from collections.abc import MutableMapping as Map
 
@@ -123,7 +122,7 @@ class ParamsMergeDefaults:
         -   ``ValueError`` if ``params_spec`` is None.
         -   ``ValueError`` if ``parameters`` is None.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
 
         if self.params_spec is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -172,7 +171,7 @@ class ParamsMergeDefaults:
 
     @parameters.setter
     def parameters(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "parameters"
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "Invalid parameters. Expected type dict. "
@@ -193,7 +192,7 @@ class ParamsMergeDefaults:
 
     @params_spec.setter
     def params_spec(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "params_spec"
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "Invalid params_spec. Expected type dict. "
@@ -19,7 +19,6 @@ __copyright__ = "Copyright (c) 2024 Cisco and/or its affiliates."
 __author__ = "Allen Robel"
 
 import copy
-import inspect
 import json
 import logging
 
@@ -232,7 +231,7 @@ class Results:
         Return True if there were any changes
         Otherwise, return False
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "did_anything_change"
 
         msg = f"{self.class_name}.{method_name}: ENTERED: "
         msg += f"self.action: {self.action}, "
@@ -284,12 +283,15 @@ class Results:
         - self.diff      : list of diffs
         - self.metadata  : list of metadata
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "register_task_result"
 
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"ENTERED: self.action: {self.action}, "
-        msg += f"self.result_current: {self.result_current}"
-        self.log.debug(msg)
+        self.log.debug(
+            "%s.%s: ENTERED: self.action: %s, self.result_current: %s",
+            self.class_name,
+            method_name,
+            self.action,
+            self.result_current,
+        )
 
         self.increment_task_sequence_number()
         self.metadata = self.metadata_current
@@ -307,28 +309,31 @@ class Results:
         elif self.result_current.get("success") is False:
             self.failed = True
         else:
-            msg = f"{self.class_name}.{method_name}: "
-            msg += "self.result_current['success'] is not a boolean. "
-            msg += f"self.result_current: {self.result_current}. "
-            msg += "Setting self.failed to False."
-            self.log.debug(msg)
+            self.log.debug(
+                "%s.%s: self.result_current['success'] is not a boolean. "
+                "self.result_current: %s. Setting self.failed to False.",
+                self.class_name,
+                method_name,
+                self.result_current,
+            )
             self.failed = False
 
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"self.diff: {json.dumps(self.diff, indent=4, sort_keys=True)}, "
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"self.diff: {json.dumps(self.diff, indent=4, sort_keys=True)}, "
+            self.log.debug(msg)
 
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"self.metadata: {json.dumps(self.metadata, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"self.metadata: {json.dumps(self.metadata, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"self.response: {json.dumps(self.response, indent=4, sort_keys=True)}, "
-        self.log.debug(msg)
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"self.response: {json.dumps(self.response, indent=4, sort_keys=True)}, "
+            self.log.debug(msg)
 
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"self.result: {json.dumps(self.result, indent=4, sort_keys=True)}, "
-        self.log.debug(msg)
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"self.result: {json.dumps(self.result, indent=4, sort_keys=True)}, "
+            self.log.debug(msg)
 
     def build_final_result(self):
         """
@@ -412,7 +417,7 @@ class Results:
 
     @action.setter
     def action(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "action"
         if not isinstance(value, str):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"instance.{method_name} must be a string. "
@@ -442,7 +447,7 @@ class Results:
 
     @changed.setter
     def changed(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "changed"
         if not isinstance(value, bool):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"instance.changed must be a bool. Got {value}"
@@ -463,7 +468,7 @@ class Results:
 
     @check_mode.setter
     def check_mode(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "check_mode"
         if not isinstance(value, bool):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"instance.{method_name} must be a bool. "
@@ -486,7 +491,7 @@ class Results:
 
     @diff.setter
     def diff(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "diff"
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"instance.diff must be a dict. Got {value}"
@@ -510,7 +515,7 @@ class Results:
 
     @diff_current.setter
     def diff_current(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "diff_current"
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.diff_current must be a dict. "
@@ -533,7 +538,7 @@ class Results:
 
     @failed.setter
     def failed(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "failed"
         if not isinstance(value, bool):
             # Setting failed, itself failed(!)
             # Add True to failed to indicate this.
@@ -558,7 +563,7 @@ class Results:
 
     @metadata.setter
     def metadata(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "metadata"
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"instance.metadata must be a dict. Got {value}"
@@ -601,7 +606,7 @@ class Results:
 
     @response_current.setter
     def response_current(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "response_current"
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.response_current must be a dict. "
@@ -625,7 +630,7 @@ class Results:
 
     @response.setter
     def response(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "response"
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.response must be a dict. "
@@ -668,7 +673,7 @@ class Results:
 
     @result.setter
     def result(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "result"
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.result must be a dict. "
@@ -694,7 +699,7 @@ class Results:
 
     @result_current.setter
     def result_current(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "result_current"
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.result_current must be a dict. "
@@ -717,7 +722,7 @@ class Results:
 
     @state.setter
     def state(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "state"
         if not isinstance(value, str):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"instance.{method_name} must be a string. "
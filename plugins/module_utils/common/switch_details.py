@@ -219,7 +219,7 @@ class SwitchDetails:
         -   ``ValueError`` if ``filter`` is not in the controller response.
         -   ``ValueError`` if item is not in the filtered switch dict.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_get"
 
         if self.filter is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -401,7 +401,7 @@ class SwitchDetails:
             To resolve ``inconsistent`` state, a switch ``config-deploy``
             must be initiated on the controller.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "maintenance_mode"
         if self.mode is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "mode is not set. Either 'filter' has not been "
@@ -523,7 +523,7 @@ class FabricDetailsByName(FabricDetails):
 
         See also: ``_get_nv_pair()``
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_get"
 
         msg = f"{self.class_name}.{method_name}: "
         msg += f"instance.filter {self.filter} "
@@ -563,7 +563,7 @@ class FabricDetailsByName(FabricDetails):
         ### See also
         ``self._get()``
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_get_nv_pair"
 
         msg = f"{self.class_name}.{method_name}: "
         msg += f"instance.filter {self.filter} "
@@ -143,7 +143,6 @@ EXAMPLES = """
 """
 # pylint: disable=wrong-import-position
 import copy
-import inspect
 import json
 import logging
 
@@ -160,6 +159,19 @@ from ..module_utils.common.rest_send_v2 import RestSend
 from ..module_utils.common.results import Results
 from ..module_utils.common.sender_dcnm import Sender
 
+ARGUMENT_SPEC = {
+    "config": {
+        "required": True,
+        "type": "dict",
+    },
+    "state": {
+        "choices": ["merged", "query"],
+        "default": "merged",
+        "required": False,
+        "type": "str",
+    },
+}
+
 
 def json_pretty(msg):
     """
@@ -295,7 +307,7 @@ class ParamsSpec:
         """
         -   setter: set the params
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "params"
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}.setter: "
             msg += "Invalid type. Expected dict but "
@@ -405,11 +417,7 @@ class Want:
             msg += "params_spec is not set, and is required."
             raise ValueError(msg)
 
-        try:
-            self.params_spec.params = self.params
-        except ValueError as error:
-            raise ValueError(error) from error
-
+        self.params_spec.params = self.params
         self.params_spec.commit()
 
     def validate_configs(self) -> None:
@@ -423,12 +431,14 @@ class Want:
 
         ### Notes
         -   validator is already verified in commit()s
+        -   Each merged config is a fresh copy from ParamsMergeDefaults(),
+            so it is appended to self.want without copying.
         """
         self.validator.params_spec = self.params_spec.params_spec
         for config in self.merged_configs:
             self.validator.parameters = config
             self.validator.commit()
-            self.want.append(copy.deepcopy(config))
+            self.want.append(config)
 
     def build_merged_configs(self) -> None:
         """
@@ -448,9 +458,10 @@ class Want:
             merge_defaults.commit()
             self.merged_configs.append(merge_defaults.merged_parameters)
 
-        msg = f"{self.class_name}.build_merged_configs(): "
-        msg += f"merged_configs: {json.dumps(self.merged_configs, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = f"{self.class_name}.build_merged_configs(): "
+            msg += f"merged_configs: {json_pretty(self.merged_configs)}"
+            self.log.debug(msg)
 
     def commit(self) -> None:
         """
@@ -475,7 +486,7 @@ class Want:
         ### self.want structure
         See class docstring.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
 
         if self.validator is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -528,7 +539,7 @@ class Want:
                 from global_config.
             -   If item_config has a parameter, use it.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_merge_global_and_item_configs"
 
         if self.config is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -543,23 +554,26 @@ class Want:
             msg += f"playbook is missing list of {self.items_key}."
             raise ValueError(msg)
 
-        self.item_configs = []
-        merged_configs = []
-        for item in self.config[self.items_key]:
-            # we need to rebuild global_config in this loop
-            # because merge_dicts modifies it in place
-            global_config = copy.deepcopy(self.config)
-            global_config.pop(self.items_key, None)
+        # merge_dicts.dict1 setter stores a deepcopy of its value, so
+        # global_config is not modified by the merge and can be built
+        # once, outside the loop.
+        global_config = {
+            key: value
+            for key, value in self.config.items()
+            if key != self.items_key
+        }
 
+        if self.log.isEnabledFor(logging.DEBUG):
             msg = f"{self.class_name}.{method_name}: "
-            msg += "global_config: "
-            msg += f"{json.dumps(global_config, indent=4, sort_keys=True)}"
+            msg += f"global_config: {json_pretty(global_config)}"
             self.log.debug(msg)
 
-            msg = f"{self.class_name}.{method_name}: "
-            msg += "switch PRE_MERGE: "
-            msg += f"{json.dumps(item, indent=4, sort_keys=True)}"
-            self.log.debug(msg)
+        merged_configs = []
+        for item in self.config[self.items_key]:
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"switch PRE_MERGE: {json_pretty(item)}"
+                self.log.debug(msg)
 
             try:
                 self.merge_dicts.dict1 = global_config
@@ -572,13 +586,13 @@ class Want:
                 msg += f"Error detail: {error}"
                 raise ValueError(msg) from error
 
-            msg = f"{self.class_name}.{method_name}: "
-            msg += "switch POST_MERGE: "
-            msg += f"{json.dumps(item_config, indent=4, sort_keys=True)}"
-            self.log.debug(msg)
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"switch POST_MERGE: {json_pretty(item_config)}"
+                self.log.debug(msg)
 
             merged_configs.append(item_config)
-        self.item_configs = copy.copy(merged_configs)
+        self.item_configs = merged_configs
 
     @property
     def config(self):
@@ -691,22 +705,31 @@ class Want:
 
     @params_spec.setter
     def params_spec(self, value) -> None:
-        method_name = inspect.stack()[0][3]
-        _class_have = None
+        method_name = "params_spec"
         _class_need = "ParamsSpec"
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"value must be an instance of {_class_need}. "
-        msg += f"Got type {type(value).__name__}, "
-        msg += f"value {value}. "
         try:
             _class_have = value.class_name
         except AttributeError as error:
+            msg = self._invalid_instance_msg(method_name, _class_need, value)
             msg += f"Error detail: {error}."
             raise TypeError(msg) from error
         if _class_have != _class_need:
+            msg = self._invalid_instance_msg(method_name, _class_need, value)
             raise TypeError(msg)
         self._params_spec = value
 
+    def _invalid_instance_msg(self, method_name, class_need, value) -> str:
+        """
+        ### Summary
+        Return the ``TypeError`` message used by the ``params_spec`` and
+        ``validator`` setters.  Built only when the setter is about to raise.
+        """
+        msg = f"{self.class_name}.{method_name}: "
+        msg += f"value must be an instance of {class_need}. "
+        msg += f"Got type {type(value).__name__}, "
+        msg += f"value {value}. "
+        return msg
+
     @property
     def validator(self):
         """
@@ -727,19 +750,16 @@ class Want:
 
     @validator.setter
     def validator(self, value) -> None:
-        method_name = inspect.stack()[0][3]
-        _class_have = None
+        method_name = "validator"
         _class_need = "ParamsValidate"
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"value must be an instance of {_class_need}. "
-        msg += f"Got type {type(value).__name__}, "
-        msg += f"value {value}. "
         try:
             _class_have = value.class_name
         except AttributeError as error:
+            msg = self._invalid_instance_msg(method_name, _class_need, value)
             msg += f" Error detail: {error}."
             raise TypeError(msg) from error
         if _class_have != _class_need:
+            msg = self._invalid_instance_msg(method_name, _class_need, value)
             raise TypeError(msg)
         self._validator = value
 
@@ -761,7 +781,7 @@ class Common:
                 -   ``config`` is not a dict
         """
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = "__init__"
 
         self.params = params
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
@@ -801,10 +821,12 @@ class Common:
         self.query = []
         self.want = []
 
-        msg = f"ENTERED Common().{method_name}: "
-        msg += f"state: {self.state}, "
-        msg += f"check_mode: {self.check_mode}"
-        self.log.debug(msg)
+        self.log.debug(
+            "ENTERED Common().%s: state: %s, check_mode: %s",
+            method_name,
+            self.state,
+            self.check_mode,
+        )
 
     def get_want(self) -> None:
         """
@@ -823,7 +845,7 @@ class Common:
             instance.validator = ParamsValidate()
             instance.commit()
             self.want = instance.want
-        except (TypeError, ValueError) as error:
+        except TypeError as error:
             raise ValueError(error) from error
 
 
@@ -841,7 +863,7 @@ class Merged(Common):
         -   ``ValueError`` if Common().__init__() raises ``ValueError``
         """
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = "__init__"
         try:
             super().__init__(params)
         except (TypeError, ValueError) as error:
@@ -850,14 +872,15 @@ class Merged(Common):
             msg += f"Error detail: {error}"
             raise ValueError(msg) from error
 
-        self.log = logging.getLogger(f"dcnm.{self.class_name}")
-
-        self.maintenance_mode = MaintenanceMode(params)
+        # Built on first access.  See the maintenance_mode property.
+        self._maintenance_mode = None
 
-        msg = f"ENTERED Merged.{method_name}: "
-        msg += f"state: {self.state}, "
-        msg += f"check_mode: {self.check_mode}"
-        self.log.debug(msg)
+        self.log.debug(
+            "ENTERED Merged.%s: state: %s, check_mode: %s",
+            method_name,
+            self.state,
+            self.check_mode,
+        )
 
         self.need = []
 
@@ -910,7 +933,7 @@ class Merged(Common):
         }
         ```
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = "get_have"
 
         try:
             instance = MaintenanceModeInfo(self.params)
@@ -938,7 +961,7 @@ class Merged(Common):
         ### Raises
         -   ``ValueError`` if any of the above cases are true
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "fabric_deployment_disabled"
         for ip_address, value in self.have.items():
             fabric_name = value.get("fabric_name")
             mode = value.get("mode")
@@ -1027,7 +1050,7 @@ class Merged(Common):
             }
         ]
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "get_need"
         self.need = []
         for want in self.want:
             ip_address = want.get("ip_address", None)
@@ -1036,17 +1059,21 @@ class Merged(Common):
                 msg += f"Switch {ip_address} not found on the controller."
                 raise ValueError(msg)
 
-            serial_number = self.have[ip_address]["serial_number"]
-            fabric_name = self.have[ip_address]["fabric_name"]
-            if want.get("mode") != self.have[ip_address]["mode"]:
-                need = want
-                need.update({"deploy": want.get("deploy")})
-                need.update({"fabric_name": fabric_name})
-                need.update({"ip_address": ip_address})
-                need.update({"mode": want.get("mode")})
-                need.update({"serial_number": serial_number})
-                need.update({"wait_for_mode_change": want.get("wait_for_mode_change")})
-                self.need.append(copy.copy(need))
+            have = self.have[ip_address]
+            if want.get("mode") == have["mode"]:
+                continue
+            # Build a new dict rather than updating want, which would
+            # modify self.want in place.
+            self.need.append(
+                {
+                    "deploy": want.get("deploy"),
+                    "fabric_name": have["fabric_name"],
+                    "ip_address": ip_address,
+                    "mode": want.get("mode"),
+                    "serial_number": have["serial_number"],
+                    "wait_for_mode_change": want.get("wait_for_mode_change"),
+                }
+            )
 
     def commit(self):
         """
@@ -1060,9 +1087,8 @@ class Merged(Common):
                 -   ``get_have()`` raises ``ValueError``
                 -   ``send_need()`` raises ``ValueError``
         """
-        method_name = inspect.stack()[0][3]
-        msg = f"{self.class_name}.{method_name}: entered"
-        self.log.debug(msg)
+        method_name = "commit"
+        self.log.debug("%s.%s: entered", self.class_name, method_name)
 
         if self.rest_send is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -1080,10 +1106,7 @@ class Merged(Common):
         if len(self.want) == 0:
             return
 
-        try:
-            self.get_have()
-        except ValueError as error:
-            raise ValueError(error) from error
+        self.get_have()
 
         self.fabric_deployment_disabled()
 
@@ -1107,7 +1130,7 @@ class Merged(Common):
             ``TypeError`` or ``ValueError``
 
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = "send_need"
 
         if len(self.need) == 0:
             msg = f"{self.class_name}.{method_name}: "
@@ -1120,9 +1143,33 @@ class Merged(Common):
             self.maintenance_mode.results = self.results
             self.maintenance_mode.config = self.need
             self.maintenance_mode.commit()
-        except (TypeError, ValueError) as error:
+        except TypeError as error:
             raise ValueError(error) from error
 
+    @property
+    def maintenance_mode(self):
+        """
+        ### Summary
+        The ``MaintenanceMode()`` instance used to send the need to the
+        controller.
+
+        It is built on first access, so that it is not built when the
+        playbook resolves to a no-op (empty want or empty need).
+
+        ### getter
+        Return maintenance_mode
+
+        ### setter
+        Set maintenance_mode
+        """
+        if self._maintenance_mode is None:
+            self._maintenance_mode = MaintenanceMode(self.params)
+        return self._maintenance_mode
+
+    @maintenance_mode.setter
+    def maintenance_mode(self, value):
+        self._maintenance_mode = value
+
 
 class Query(Common):
     """
@@ -1140,7 +1187,7 @@ class Query(Common):
         -   ``ValueError`` if Common().__init__() raises ``ValueError``
         """
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = "__init__"
         try:
             super().__init__(params)
         except (TypeError, ValueError) as error:
@@ -1149,14 +1196,14 @@ class Query(Common):
             msg += f"Error detail: {error}"
             raise ValueError(msg) from error
 
-        self.log = logging.getLogger(f"dcnm.{self.class_name}")
+        # Built on first access.  See the maintenance_mode_info property.
+        self._maintenance_mode_info = None
 
-        self.maintenance_mode_info = MaintenanceModeInfo(self.params)
-
-        msg = "ENTERED Query(): "
-        msg += f"state: {self.state}, "
-        msg += f"check_mode: {self.check_mode}"
-        self.log.debug(msg)
+        self.log.debug(
+            "ENTERED Query(): state: %s, check_mode: %s",
+            self.state,
+            self.check_mode,
+        )
 
     def get_have(self):
         """
@@ -1206,7 +1253,7 @@ class Query(Common):
         }
         ```
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = "get_have"
 
         try:
             self.maintenance_mode_info.rest_send = self.rest_send
@@ -1234,9 +1281,8 @@ class Query(Common):
                 -   ``get_want()`` raises ``ValueError``
                 -   ``get_have()`` raises ``ValueError``
         """
-        method_name = inspect.stack()[0][3]
-        msg = f"{self.class_name}.{method_name}: entered"
-        self.log.debug(msg)
+        method_name = "commit"
+        self.log.debug("%s.%s: entered", self.class_name, method_name)
 
         if self.rest_send is None:
             msg = f"{self.class_name}.{method_name}: "
@@ -1254,45 +1300,59 @@ class Query(Common):
         if len(self.want) == 0:
             return
 
-        try:
-            self.get_have()
-        except ValueError as error:
-            msg = f"{self.class_name}.{method_name}: "
-            msg += "Error while retrieving switch information "
-            msg += "from the controller. "
-            msg += f"Error detail: {error}"
-            raise ValueError(msg) from error
+        self.get_have()
 
         # If we got this far, the requests were successful.
         self.results.action = "maintenance_mode_info"
         self.results.changed = False
         self.results.diff_current = self.have
         self.results.failed = False
-        self.results.response_current = {"MESSAGE": "MaintenanceModeInfo OK."}
-        self.results.response_current.update({"METHOD": "NA"})
-        self.results.response_current.update({"REQUEST_PATH": "NA"})
-        self.results.response_current.update({"RETURN_CODE": 200})
+        self.results.response_current = {
+            "MESSAGE": "MaintenanceModeInfo OK.",
+            "METHOD": "NA",
+            "REQUEST_PATH": "NA",
+            "RETURN_CODE": 200,
+        }
         self.results.result_current = {"changed": False, "success": True}
         self.results.register_task_result()
 
+    @property
+    def maintenance_mode_info(self):
+        """
+        ### Summary
+        The ``MaintenanceModeInfo()`` instance used to query the
+        controller.
+
+        It is built on first access, so that it is not built when the
+        playbook resolves to a no-op (empty want).
+
+        ### getter
+        Return maintenance_mode_info
+
+        ### setter
+        Set maintenance_mode_info
+        """
+        if self._maintenance_mode_info is None:
+            self._maintenance_mode_info = MaintenanceModeInfo(self.params)
+        return self._maintenance_mode_info
+
+    @maintenance_mode_info.setter
+    def maintenance_mode_info(self, value):
+        self._maintenance_mode_info = value
+
+
+# Task class for each supported state.
+STATE_TASKS = {
+    "merged": Merged,
+    "query": Query,
+}
+
 
 def main():
     """main entry point for module execution"""
 
-    argument_spec = {}
-    argument_spec["config"] = {
-        "required": True,
-        "type": "dict",
-    }
-    argument_spec["state"] = {
-        "choices": ["merged", "query"],
-        "default": "merged",
-        "required": False,
-        "type": "str",
-    }
-
     ansible_module = AnsibleModule(
-        argument_spec=argument_spec, supports_check_mode=True
+        argument_spec=ARGUMENT_SPEC, supports_check_mode=True
     )
     params = copy.deepcopy(ansible_module.params)
     params["check_mode"] = ansible_module.check_mode
@@ -1310,28 +1370,20 @@ def main():
     rest_send.response_handler = ResponseHandler()
     rest_send.sender = sender
 
-    if params["state"] == "merged":
-        try:
-            task = Merged(params)
-            task.rest_send = rest_send  # pylint: disable=attribute-defined-outside-init
-            task.commit()
-        except ValueError as error:
-            ansible_module.fail_json(f"{error}", **task.results.failed_result)
-
-    elif params["state"] == "query":
-        try:
-            task = Query(params)
-            task.rest_send = rest_send  # pylint: disable=attribute-defined-outside-init
-            task.commit()
-        except ValueError as error:
-            ansible_module.fail_json(f"{error}", **task.results.failed_result)
-
-    else:
+    task_class = STATE_TASKS.get(params["state"])
+    if task_class is None:
         # We should never get here since the state parameter has
         # already been validated.
         msg = f"Unknown state {params['state']}"
         ansible_module.fail_json(msg)
 
+    try:
+        task = task_class(params)
+        task.rest_send = rest_send  # pylint: disable=attribute-defined-outside-init
+        task.commit()
+    except ValueError as error:
+        ansible_module.fail_json(f"{error}", **task.results.failed_result)
+
     task.results.build_final_result()
 
     # Results().failed is a property that returns a set()
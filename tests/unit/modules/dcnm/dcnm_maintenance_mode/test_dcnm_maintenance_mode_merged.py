@@ -81,6 +81,7 @@ def test_dcnm_maintenance_mode_merged_00000() -> None:
     assert instance.query == []
     assert instance.want == []
 
+    assert instance._maintenance_mode is None
     assert instance.maintenance_mode.class_name == "MaintenanceMode"
     assert instance.maintenance_mode.state == "merged"
     assert instance.maintenance_mode.check_mode is False
@@ -718,6 +719,64 @@ def test_dcnm_maintenance_mode_merged_00300(monkeypatch) -> None:
     assert len(instance.results.result) == 0
 
 
+def test_dcnm_maintenance_mode_merged_00310() -> None:
+    """
+    ### Classes and Methods
+    - Merged()
+        - get_need()
+
+    ### Summary
+    -   Verify ``get_need()`` adds only switches whose mode differs
+        from the controller.
+    -   Verify ``get_need()`` does not modify ``self.want``.
+    """
+    want = [
+        {
+            "deploy": True,
+            "ip_address": "192.168.1.2",
+            "mode": "maintenance",
+            "wait_for_mode_change": True,
+        },
+        {
+            "deploy": False,
+            "ip_address": "192.168.1.3",
+            "mode": "normal",
+            "wait_for_mode_change": False,
+        },
+    ]
+    have = {
+        "192.168.1.2": {
+            "fabric_name": "VXLAN_Fabric",
+            "mode": "normal",
+            "serial_number": "FDO211218GC",
+        },
+        "192.168.1.3": {
+            "fabric_name": "VXLAN_Fabric",
+            "mode": "normal",
+            "serial_number": "FDO211218HH",
+        },
+    }
+    want_copy = copy.deepcopy(want)
+
+    with does_not_raise():
+        instance = Merged(params)
+        instance.want = want
+        instance.have = have
+        instance.get_need()
+
+    assert instance.need == [
+        {
+            "deploy": True,
+            "fabric_name": "VXLAN_Fabric",
+            "ip_address": "192.168.1.2",
+            "mode": "maintenance",
+            "serial_number": "FDO211218GC",
+            "wait_for_mode_change": True,
+        }
+    ]
+    assert instance.want == want_copy
+
+
 def test_dcnm_maintenance_mode_merged_00400(monkeypatch) -> None:
     """
     ### Classes and Methods
@@ -76,6 +76,9 @@ def test_dcnm_maintenance_mode_query_00000() -> None:
     assert instance.query == []
     assert instance.want == []
 
+    assert instance._maintenance_mode_info is None
+    assert instance.maintenance_mode_info.class_name == "MaintenanceModeInfo"
+
     assert instance.results.class_name == "Results"
     assert instance.results.state == "query"
     assert instance.results.check_mode is False
@@ -238,9 +241,7 @@ def test_dcnm_maintenance_mode_query_00300(monkeypatch) -> None:
     def mock_get_have():
         raise ValueError("Query.get_need: Mocked ValueError.")
 
-    match = r"Query\.commit:\s+"
-    match += r"Error while retrieving switch information from the controller\.\s+"
-    match += r"Error detail: Query\.get_need: Mocked ValueError\."
+    match = r"Query\.get_need: Mocked ValueError\."
     with pytest.raises(ValueError, match=match):
         monkeypatch.setattr(instance, "get_have", mock_get_have)
         instance.commit()
@@ -359,11 +360,7 @@ def test_dcnm_maintenance_mode_query_00600(monkeypatch) -> None:
             """
             raise ValueError("MockMaintenanceModeInfo.refresh: Mocked ValueError.")
 
-    match = r"Query\.commit:\s+"
-    match += r"Error while retrieving switch information from the\s+"
-    match += r"controller\.\s+"
-    match += r"Error detail:\s+"
-    match += r"Query\.get_have: Error while retrieving switch info\.\s+"
+    match = r"Query\.get_have: Error while retrieving switch info\.\s+"
     match += r"Error detail: MockMaintenanceModeInfo\.refresh:\s+"
     match += r"Mocked ValueError\."
     with pytest.raises(ValueError, match=match):
@@ -16,6 +16,7 @@
 # https://pylint.pycqa.org/en/latest/user_guide/messages/warning/redefined-outer-name.html
 # Due to the above, we also need to disable unused-import
 # Also, fixtures need to use *args to match the signature of the function they are mocking
+# pylint: disable=unused-import
 # pylint: disable=protected-access
 # pylint: disable=use-implicit-booleaness-not-comparison
 
@@ -26,18 +27,140 @@ __metaclass__ = type
 __copyright__ = "Copyright (c) 2024 Cisco and/or its affiliates."
 __author__ = "Allen Robel"
 
-import copy
-import inspect
-
 import pytest
-from ansible_collections.cisco.dcnm.plugins.modules.dcnm_maintenance_mode import (
-    ParamsSpec, Want)
-from ansible_collections.cisco.dcnm.tests.unit.module_utils.common.common_utils import \
-    ResponseGenerator
-from ansible_collections.cisco.dcnm.tests.unit.module_utils.common.test_params_validate_v2 import \
-    ParamsValidate
+from ansible_collections.cisco.dcnm.plugins.modules.dcnm_maintenance_mode import \
+    Want
 from ansible_collections.cisco.dcnm.tests.unit.modules.dcnm.dcnm_maintenance_mode.utils import (
-    configs_want, does_not_raise, params)
+    configs_want, current_test_name, does_not_raise, params,
+    params_spec_fixture, params_validate_fixture)
+
+
+_MATCH_VALIDATOR_NOT_SET = (
+    r"Want\.commit:\s+"
+    r"self\.validator must be set before calling commit\."
+)
+
+_MATCH_PARAMS_NOT_SET = (
+    r"Want\.commit:\s+"
+    r"Error generating params_spec\.\s+"
+    r"Error detail:\s+"
+    r"Want\.generate_params_spec\(\):\s+"
+    r"params is not set, and is required\."
+)
+
+_MATCH_PARAMS_SPEC_NOT_SET = (
+    r"Want\.commit:\s+"
+    r"Error generating params_spec\.\s+"
+    r"Error detail:\s+"
+    r"Want\.generate_params_spec\(\):\s+"
+    r"params_spec is not set, and is required\."
+)
+
+_MATCH_CONFIG_NOT_SET = (
+    r"Want\.commit:\s+"
+    r"Error merging global and item configs\.\s+"
+    r"Error detail:\s+"
+    r"Want\._merge_global_and_item_configs:\s+"
+    r"config is not set, and is required\."
+)
+
+_MATCH_ITEMS_KEY_NOT_SET = (
+    r"Want\.commit:\s+"
+    r"Error merging global and item configs\.\s+"
+    r"Error detail:\s+"
+    r"Want\._merge_global_and_item_configs:\s+"
+    r"items_key is not set, and is required\."
+)
+
+_MATCH_ITEMS_KEY_NOT_IN_CONFIG = (
+    r"Want\.commit:\s+"
+    r"Error merging global and item configs\.\s+"
+    r"Error detail:\s+"
+    r"Want\._merge_global_and_item_configs:\s+"
+    r"playbook is missing list of NOT_PRESENT_IN_CONFIG\."
+)
+
+_MATCH_MERGE_DICTS_ERROR = (
+    r"Want\.commit: Error merging global and item configs\.\s+"
+    r"Error detail:\s+"
+    r"Want\._merge_global_and_item_configs:\s+"
+    r"Error in MergeDicts\(\)\.\s+"
+    r"Error detail: MergeDicts\(\)\.commit\(\)\. ValueError\."
+)
+
+_MATCH_VALIDATE_CONFIGS_ERROR = (
+    r"Want\.commit:\s+"
+    r"Error validating playbook configs against params spec\.\s+"
+    r"Error detail: validate_configs ValueError\."
+)
+
+_MATCH_CONFIG_NOT_DICT = (
+    r"Want\.config\.setter:\s+"
+    r"expected dict but got str, value NOT_A_DICT\."
+)
+
+_MATCH_ITEMS_KEY_NOT_STRING = (
+    r"Want\.items_key\.setter:\s+"
+    r"expected string but got set, value {'NOT_A_STRING'}\."
+)
+
+_MATCH_PARAMS_NOT_DICT = (
+    r"Want\.params\.setter:\s+"
+    r"expected dict but got str, value NOT_A_DICT\."
+)
+
+_MATCH_PARAMS_SPEC_NOT_INSTANCE = (
+    r"Want\.params_spec:\s+"
+    r"value must be an instance of ParamsSpec\.\s+"
+    r"Got type str, value NOT_AN_INSTANCE_OF_PARAMS_SPEC\.\s+"
+    r"Error detail: 'str' object has no attribute 'class_name'\."
+)
+
+_MATCH_PARAMS_SPEC_WRONG_CLASS = (
+    r"Want\.params_spec:\s+"
+    r"value must be an instance of ParamsSpec\.\s+"
+    r"Got type ParamsValidate, value .* object at 0x.*\."
+)
+
+_MATCH_VALIDATOR_NOT_INSTANCE = (
+    r"Want\.validator:\s+"
+    r"value must be an instance of ParamsValidate\.\s+"
+    r"Got type str, value NOT_AN_INSTANCE_OF_PARAMS_VALIDATE\.\s+"
+    r"Error detail: 'str' object has no attribute 'class_name'\."
+)
+
+_MATCH_VALIDATOR_WRONG_CLASS = (
+    r"Want\.validator:\s+"
+    r"value must be an instance of ParamsValidate\.\s+"
+    r"Got type ParamsSpec, value .* object at 0x.*\."
+)
+
+
+class MockMergeDicts:  # pylint: disable=too-few-public-methods
+    """
+    Mock class for MergeDicts().
+    """
+
+    @staticmethod
+    def commit():
+        """
+        ### Summary
+        Mock method for MergeDicts().commit().
+
+        ### Raises
+        ValueError: Always
+        """
+        raise ValueError("MergeDicts().commit(). ValueError.")
+
+
+def mock_validate_configs():
+    """
+    Mock method for Want().validate_configs().
+
+    ### Raises
+    ValueError: Always
+    """
+    raise ValueError("validate_configs ValueError.")
 
 
 def test_dcnm_maintenance_mode_want_00000() -> None:
@@ -66,7 +189,7 @@ def test_dcnm_maintenance_mode_want_00000() -> None:
     assert instance.item_configs == []
 
 
-def test_dcnm_maintenance_mode_want_00100() -> None:
+def test_dcnm_maintenance_mode_want_00100(params_spec, params_validate) -> None:
     """
     ### Classes and Methods
     - Want()
@@ -77,345 +200,133 @@ def test_dcnm_maintenance_mode_want_00100() -> None:
     -   No exceptions are raised.
     -   want contains expected structure and values.
     """
-    method_name = inspect.stack()[0][3]
-    key = f"{method_name}a"
-
-    def configs():
-        yield configs_want(key)
-
-    gen = ResponseGenerator(configs())
-
-    params_test = copy.deepcopy(params)
-    params_test.update({"config": gen.next})
-
-    with does_not_raise():
-        instance = Want()
-        instance.items_key = "switches"
-        instance.config = params_test.get("config")
-        instance.params = params_test
-        instance.params_spec = ParamsSpec()
-        instance.validator = ParamsValidate()
-        instance.commit()
-    assert instance.want[0].get("deploy", None) is True
-    assert instance.want[0].get("ip_address", None) == "192.168.1.2"
-    assert instance.want[0].get("mode", None) == "normal"
-    assert instance.want[0].get("wait_for_mode_change", None) is True
-    assert instance.want[1].get("deploy", None) is True
-    assert instance.want[1].get("ip_address", None) == "192.168.1.3"
-    assert instance.want[1].get("mode", None) == "normal"
-    assert instance.want[1].get("wait_for_mode_change", None) is True
-
-
-def test_dcnm_maintenance_mode_want_00110() -> None:
-    """
-    ### Classes and Methods
-    - Want()
-        - commit()
-
-    ### Summary
-    -   Verify ``ValueError`` is raised.
-    -   Want().validator is not set prior to calling commit().
-    """
-    method_name = inspect.stack()[0][3]
+    method_name = current_test_name()
     key = f"{method_name}a"
 
-    def configs():
-        yield configs_want(key)
-
-    gen = ResponseGenerator(configs())
-
-    params_test = copy.deepcopy(params)
-    params_test.update({"config": gen.next})
+    params_test = {**params, "config": configs_want(key)}
 
     with does_not_raise():
         instance = Want()
         instance.items_key = "switches"
         instance.config = params_test.get("config")
         instance.params = params_test
-        instance.params_spec = ParamsSpec()
-    match = r"Want\.commit:\s+"
-    match += r"self\.validator must be set before calling commit\."
-    with pytest.raises(ValueError, match=match):
-        instance.commit()
-
-
-def test_dcnm_maintenance_mode_want_00120() -> None:
-    """
-    ### Classes and Methods
-    - Want()
-        - commit()
-
-    ### Summary
-    -   Verify Want().commit() catches and re-raises ``ValueError``.
-    -   Want().generate_params_spec() raises ``ValueError`` because
-        ``params`` is not set.
-    """
-    method_name = inspect.stack()[0][3]
-    key = f"{method_name}a"
-
-    def configs():
-        yield configs_want(key)
-
-    gen = ResponseGenerator(configs())
-
-    params_test = copy.deepcopy(params)
-    params_test.update({"config": gen.next})
-
-    with does_not_raise():
-        instance = Want()
-        instance.items_key = "switches"
-        instance.config = params_test.get("config")
-        instance.params_spec = ParamsSpec()
-        instance.validator = ParamsValidate()
-    match = r"Want\.commit:\s+"
-    match += r"Error generating params_spec\.\s+"
-    match += r"Error detail:\s+"
-    match += r"Want\.generate_params_spec\(\):\s+"
-    match += r"params is not set, and is required\."
-    with pytest.raises(ValueError, match=match):
+        instance.params_spec = params_spec
+        instance.validator = params_validate
         instance.commit()
-
-
-def test_dcnm_maintenance_mode_want_00121() -> None:
+    expected = [
+        {
+            "deploy": True,
+            "ip_address": "192.168.1.2",
+            "mode": "normal",
+            "wait_for_mode_change": True,
+        },
+        {
+            "deploy": True,
+            "ip_address": "192.168.1.3",
+            "mode": "normal",
+            "wait_for_mode_change": True,
+        },
+    ]
+    actual = [{name: item.get(name) for name in expected[0]} for item in instance.want]
+    assert actual == expected
+
+
+@pytest.mark.parametrize(
+    "unset, match",
+    [
+        ("validator", _MATCH_VALIDATOR_NOT_SET),
+        ("params", _MATCH_PARAMS_NOT_SET),
+        ("params_spec", _MATCH_PARAMS_SPEC_NOT_SET),
+        ("config", _MATCH_CONFIG_NOT_SET),
+        ("items_key", _MATCH_ITEMS_KEY_NOT_SET),
+    ],
+)
+def test_dcnm_maintenance_mode_want_00110(
+    params_spec, params_validate, unset, match
+) -> None:
     """
     ### Classes and Methods
     - Want()
         - commit()
 
     ### Summary
-    -   Verify Want().commit() catches and re-raises ``ValueError``.
-    -   Want().generate_params_spec() raises ``ValueError`` because
-        ``params_spec`` is not set.
-    """
-    method_name = inspect.stack()[0][3]
-    key = f"{method_name}a"
-
-    def configs():
-        yield configs_want(key)
+    -   Verify Want().commit() raises ``ValueError`` when a required
+        property is not set prior to calling commit().
 
-    gen = ResponseGenerator(configs())
-
-    params_test = copy.deepcopy(params)
-    params_test.update({"config": gen.next})
-
-    with does_not_raise():
-        instance = Want()
-        instance.items_key = "switches"
-        instance.config = params_test.get("config")
-        instance.params = params_test
-        instance.validator = ParamsValidate()
-    match = r"Want\.commit:\s+"
-    match += r"Error generating params_spec\.\s+"
-    match += r"Error detail:\s+"
-    match += r"Want\.generate_params_spec\(\):\s+"
-    match += r"params_spec is not set, and is required\."
-    with pytest.raises(ValueError, match=match):
-        instance.commit()
-
-
-def test_dcnm_maintenance_mode_want_00130() -> None:
-    """
-    ### Classes and Methods
-    - Want()
-        - commit()
-
-    ### Summary
-    -   Verify Want().commit() catches and re-raises ``ValueError``.
-    -   Want()._merge_global_and_item_configs() raises ``ValueError``
-        because ``config`` is not set.
-    """
-    method_name = inspect.stack()[0][3]
-    key = f"{method_name}a"
-
-    def configs():
-        yield configs_want(key)
-
-    gen = ResponseGenerator(configs())
-
-    params_test = copy.deepcopy(params)
-    params_test.update({"config": gen.next})
-
-    with does_not_raise():
-        instance = Want()
-        instance.items_key = "switches"
-        instance.params = params_test
-        instance.params_spec = ParamsSpec()
-        instance.validator = ParamsValidate()
-    match = r"Want\.commit:\s+"
-    match += r"Error merging global and item configs\.\s+"
-    match += r"Error detail:\s+"
-    match += r"Want\._merge_global_and_item_configs:\s+"
-    match += r"config is not set, and is required\."
-    with pytest.raises(ValueError, match=match):
-        instance.commit()
-
-
-def test_dcnm_maintenance_mode_want_00131() -> None:
-    """
-    ### Classes and Methods
-    - Want()
-        - commit()
-
-    ### Summary
-    -   Verify Want().commit() catches and re-raises ``ValueError``.
-    -   Want()._merge_global_and_item_configs() raises ``ValueError``
-        because ``items_key`` is not set.
-    """
-    method_name = inspect.stack()[0][3]
+    ### Test
+    -   ``unset`` is the property that is not set.
+    -   ``validator``: commit() raises ``ValueError``.
+    -   ``params``, ``params_spec``: Want().generate_params_spec()
+        raises ``ValueError``, which commit() catches and re-raises.
+    -   ``config``, ``items_key``: Want()._merge_global_and_item_configs()
+        raises ``ValueError``, which commit() catches and re-raises.
+    """
+    method_name = current_test_name()
     key = f"{method_name}a"
 
-    def configs():
-        yield configs_want(key)
-
-    gen = ResponseGenerator(configs())
+    params_test = {**params, "config": configs_want(key)}
 
-    params_test = copy.deepcopy(params)
-    params_test.update({"config": gen.next})
+    properties = {
+        "items_key": "switches",
+        "config": params_test.get("config"),
+        "params": params_test,
+        "params_spec": params_spec,
+        "validator": params_validate,
+    }
+    properties.pop(unset)
 
     with does_not_raise():
         instance = Want()
-        instance.config = params_test.get("config")
-        instance.params = params_test
-        instance.params_spec = ParamsSpec()
-        instance.validator = ParamsValidate()
-    match = r"Want\.commit:\s+"
-    match += r"Error merging global and item configs\.\s+"
-    match += r"Error detail:\s+"
-    match += r"Want\._merge_global_and_item_configs:\s+"
-    match += r"items_key is not set, and is required\."
+        for name, value in properties.items():
+            setattr(instance, name, value)
     with pytest.raises(ValueError, match=match):
         instance.commit()
 
 
-def test_dcnm_maintenance_mode_want_00132() -> None:
+@pytest.mark.parametrize(
+    "attribute, value, match",
+    [
+        ("items_key", "NOT_PRESENT_IN_CONFIG", _MATCH_ITEMS_KEY_NOT_IN_CONFIG),
+        ("merge_dicts", MockMergeDicts(), _MATCH_MERGE_DICTS_ERROR),
+        ("validate_configs", mock_validate_configs, _MATCH_VALIDATE_CONFIGS_ERROR),
+    ],
+)
+def test_dcnm_maintenance_mode_want_00130(
+    monkeypatch, params_spec, params_validate, attribute, value, match
+) -> None:
     """
     ### Classes and Methods
     - Want()
         - commit()
 
     ### Summary
-    -   Verify Want().commit() catches and re-raises ``ValueError``.
-    -   Want()._merge_global_and_item_configs() raises ``ValueError``
-        because ``config`` is missing the key specified by items_key.
-    """
-    method_name = inspect.stack()[0][3]
-    key = f"{method_name}a"
-
-    def configs():
-        yield configs_want(key)
-
-    gen = ResponseGenerator(configs())
-
-    params_test = copy.deepcopy(params)
-    params_test.update({"config": gen.next})
-
-    with does_not_raise():
-        instance = Want()
-        instance.config = params_test.get("config")
-        instance.items_key = "NOT_PRESENT_IN_CONFIG"
-        instance.params = params_test
-        instance.params_spec = ParamsSpec()
-        instance.validator = ParamsValidate()
-    match = r"Want\.commit:\s+"
-    match += r"Error merging global and item configs\.\s+"
-    match += r"Error detail:\s+"
-    match += r"Want\._merge_global_and_item_configs:\s+"
-    match += r"playbook is missing list of NOT_PRESENT_IN_CONFIG\."
-    with pytest.raises(ValueError, match=match):
-        instance.commit()
-
-
-def test_dcnm_maintenance_mode_want_00133(monkeypatch) -> None:
-    """
-    ### Classes and Methods
-    - Want()
-        - commit()
+    -   Verify Want().commit() catches and re-raises ``ValueError``
+        raised while building want.
 
-    ### Summary
-    -   Verify Want().commit() catches and re-raises ``ValueError``.
-    -   Want()._merge_global_and_item_configs() raises ``ValueError``
-        because MergeDict().commit() raises ``ValueError``.
-    """
-    method_name = inspect.stack()[0][3]
+    ### Test
+    -   ``attribute`` is overridden with ``value`` after the instance
+        is fully populated.
+    -   ``items_key``: ``config`` is missing the key specified by
+        items_key, so Want()._merge_global_and_item_configs() raises
+        ``ValueError``.
+    -   ``merge_dicts``: MergeDicts().commit() is mocked to raise
+        ``ValueError``.
+    -   ``validate_configs``: Want().validate_configs() is mocked to
+        raise ``ValueError``.
+    """
+    method_name = current_test_name()
     key = f"{method_name}a"
 
-    def configs():
-        yield configs_want(key)
-
-    gen = ResponseGenerator(configs())
-
-    params_test = copy.deepcopy(params)
-    params_test.update({"config": gen.next})
-
-    class MockMergeDicts:  # pylint: disable=too-few-public-methods
-        """
-        Mock class for MergeDicts().
-        """
-
-        @staticmethod
-        def commit():
-            """
-            ### Summary
-            Mock method for MergeDicts().commit().
-
-            ### Raises
-            ValueError: Always
-            """
-            raise ValueError("MergeDicts().commit(). ValueError.")
+    params_test = {**params, "config": configs_want(key)}
 
     with does_not_raise():
         instance = Want()
-        monkeypatch.setattr(instance, "merge_dicts", MockMergeDicts)
-        instance.config = params_test.get("config")
         instance.items_key = "switches"
-        instance.params = params_test
-        instance.params_spec = ParamsSpec()
-        instance.validator = ParamsValidate()
-    match = r"Want\.commit: Error merging global and item configs\.\s+"
-    match += r"Error detail:\s+"
-    match += r"Want\._merge_global_and_item_configs:\s+"
-    match += r"Error in MergeDicts\(\)\.\s+"
-    match += r"Error detail: MergeDicts\(\)\.commit\(\)\. ValueError\."
-    with pytest.raises(ValueError, match=match):
-        instance.commit()
-
-
-def test_dcnm_maintenance_mode_want_00140(monkeypatch) -> None:
-    """
-    ### Classes and Methods
-    - Want()
-        - commit()
-
-    ### Summary
-    -   Verify Want().commit() catches and re-raises ``ValueError``
-        when Want().validate_configs() raises ``ValueError``.
-    -   Want().validate_configs() is mocked to raise ``ValueError``.
-    """
-    method_name = inspect.stack()[0][3]
-    key = f"{method_name}a"
-
-    def configs():
-        yield configs_want(key)
-
-    gen = ResponseGenerator(configs())
-
-    params_test = copy.deepcopy(params)
-    params_test.update({"config": gen.next})
-
-    def mock_def():
-        raise ValueError("validate_configs ValueError.")
-
-    with does_not_raise():
-        instance = Want()
-        monkeypatch.setattr(instance, "validate_configs", mock_def)
         instance.config = params_test.get("config")
         instance.params = params_test
-        instance.params_spec = ParamsSpec()
-        instance.items_key = "switches"
-        instance.validator = ParamsValidate()
-    match = r"Want\.commit:\s+"
-    match += r"Error validating playbook configs against params spec\.\s+"
-    match += r"Error detail: validate_configs ValueError\."
+        instance.params_spec = params_spec
+        instance.validator = params_validate
+        monkeypatch.setattr(instance, attribute, value)
     with pytest.raises(ValueError, match=match):
         instance.commit()
 
@@ -432,9 +343,7 @@ def test_dcnm_maintenance_mode_want_00200() -> None:
     with does_not_raise():
         instance = Want()
 
-    match = r"Want\.config\.setter:\s+"
-    match += r"expected dict but got str, value NOT_A_DICT\."
-    with pytest.raises(TypeError, match=match):
+    with pytest.raises(TypeError, match=_MATCH_CONFIG_NOT_DICT):
         instance.config = "NOT_A_DICT"
 
 
@@ -451,9 +360,7 @@ def test_dcnm_maintenance_mode_want_00300() -> None:
     with does_not_raise():
         instance = Want()
 
-    match = r"Want\.items_key\.setter:\s+"
-    match += r"expected string but got set, value {'NOT_A_STRING'}\."
-    with pytest.raises(TypeError, match=match):
+    with pytest.raises(TypeError, match=_MATCH_ITEMS_KEY_NOT_STRING):
         instance.items_key = {"NOT_A_STRING"}
 
 
@@ -483,13 +390,11 @@ def test_dcnm_maintenance_mode_want_00410() -> None:
     with does_not_raise():
         instance = Want()
 
-    match = r"Want\.params\.setter:\s+"
-    match += r"expected dict but got str, value NOT_A_DICT\."
-    with pytest.raises(TypeError, match=match):
+    with pytest.raises(TypeError, match=_MATCH_PARAMS_NOT_DICT):
         instance.params = "NOT_A_DICT"
 
 
-def test_dcnm_maintenance_mode_want_00500() -> None:
+def test_dcnm_maintenance_mode_want_00500(params_spec) -> None:
     """
     ### Classes and Methods
     - Want()
@@ -500,7 +405,7 @@ def test_dcnm_maintenance_mode_want_00500() -> None:
     """
     with does_not_raise():
         instance = Want()
-        instance.params_spec = ParamsSpec()
+        instance.params_spec = params_spec
 
 
 def test_dcnm_maintenance_mode_want_00510() -> None:
@@ -516,15 +421,11 @@ def test_dcnm_maintenance_mode_want_00510() -> None:
     with does_not_raise():
         instance = Want()
 
-    match = r"Want\.params_spec:\s+"
-    match += r"value must be an instance of ParamsSpec\.\s+"
-    match += r"Got type str, value NOT_AN_INSTANCE_OF_PARAMS_SPEC\.\s+"
-    match += r"Error detail: 'str' object has no attribute 'class_name'\."
-    with pytest.raises(TypeError, match=match):
+    with pytest.raises(TypeError, match=_MATCH_PARAMS_SPEC_NOT_INSTANCE):
         instance.params_spec = "NOT_AN_INSTANCE_OF_PARAMS_SPEC"
 
 
-def test_dcnm_maintenance_mode_want_00520() -> None:
+def test_dcnm_maintenance_mode_want_00520(params_validate) -> None:
     """
     ### Classes and Methods
     - Want()
@@ -538,14 +439,11 @@ def test_dcnm_maintenance_mode_want_00520() -> None:
     with does_not_raise():
         instance = Want()
 
-    match = r"Want\.params_spec:\s+"
-    match += r"value must be an instance of ParamsSpec\.\s+"
-    match += r"Got type ParamsValidate, value .* object at 0x.*\."
-    with pytest.raises(TypeError, match=match):
-        instance.params_spec = ParamsValidate()
+    with pytest.raises(TypeError, match=_MATCH_PARAMS_SPEC_WRONG_CLASS):
+        instance.params_spec = params_validate
 
 
-def test_dcnm_maintenance_mode_want_00600() -> None:
+def test_dcnm_maintenance_mode_want_00600(params_validate) -> None:
     """
     ### Classes and Methods
     - Want()
@@ -556,7 +454,7 @@ def test_dcnm_maintenance_mode_want_00600() -> None:
     """
     with does_not_raise():
         instance = Want()
-        instance.validator = ParamsValidate()
+        instance.validator = params_validate
 
 
 def test_dcnm_maintenance_mode_want_00610() -> None:
@@ -572,15 +470,11 @@ def test_dcnm_maintenance_mode_want_00610() -> None:
     with does_not_raise():
         instance = Want()
 
-    match = r"Want\.validator:\s+"
-    match += r"value must be an instance of ParamsValidate\.\s+"
-    match += r"Got type str, value NOT_AN_INSTANCE_OF_PARAMS_VALIDATE\.\s+"
-    match += r"Error detail: 'str' object has no attribute 'class_name'\."
-    with pytest.raises(TypeError, match=match):
+    with pytest.raises(TypeError, match=_MATCH_VALIDATOR_NOT_INSTANCE):
         instance.validator = "NOT_AN_INSTANCE_OF_PARAMS_VALIDATE"
 
 
-def test_dcnm_maintenance_mode_want_00620() -> None:
+def test_dcnm_maintenance_mode_want_00620(params_spec) -> None:
     """
     ### Classes and Methods
     - Want()
@@ -594,8 +488,5 @@ def test_dcnm_maintenance_mode_want_00620() -> None:
     with does_not_raise():
         instance = Want()
 
-    match = r"Want\.validator:\s+"
-    match += r"value must be an instance of ParamsValidate\.\s+"
-    match += r"Got type ParamsSpec, value .* object at 0x.*\."
-    with pytest.raises(TypeError, match=match):
-        instance.validator = ParamsSpec()
+    with pytest.raises(TypeError, match=_MATCH_VALIDATOR_WRONG_CLASS):
+        instance.validator = params_spec
@@ -16,18 +16,22 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
-
-from contextlib import contextmanager
+import copy
+import sys
+from contextlib import nullcontext
+from functools import lru_cache
 
 import pytest
 from ansible_collections.ansible.netcommon.tests.unit.modules.utils import \
     AnsibleFailJson
+from ansible_collections.cisco.dcnm.plugins.module_utils.common.params_validate_v2 import \
+    ParamsValidate
 from ansible_collections.cisco.dcnm.plugins.module_utils.common.response_handler import \
     ResponseHandler
 from ansible_collections.cisco.dcnm.plugins.module_utils.fabric.fabric_details_v2 import \
     FabricDetailsByName as FabricDetailsByNameV2
-from ansible_collections.cisco.dcnm.plugins.modules.dcnm_maintenance_mode import \
-    Common
+from ansible_collections.cisco.dcnm.plugins.modules.dcnm_maintenance_mode import (
+    Common, ParamsSpec)
 from ansible_collections.cisco.dcnm.tests.unit.modules.dcnm.dcnm_maintenance_mode.fixture import \
     load_fixture
 
@@ -109,6 +113,28 @@ def fabric_details_by_name_v2_fixture():
     return FabricDetailsByNameV2()
 
 
+@pytest.fixture(name="params_spec", scope="session")
+def params_spec_fixture():
+    """
+    Return ParamsSpec() instance.
+
+    ParamsSpec() is re-populated on each Want().commit(), so a single
+    instance is shared for the whole test session.
+    """
+    return ParamsSpec()
+
+
+@pytest.fixture(name="params_validate", scope="session")
+def params_validate_fixture():
+    """
+    Return ParamsValidate() instance.
+
+    ParamsValidate() is re-populated on each Want().commit(), so a single
+    instance is shared for the whole test session.
+    """
+    return ParamsValidate()
+
+
 @pytest.fixture(name="response_handler")
 def response_handler_fixture():
     """
@@ -117,12 +143,18 @@ def response_handler_fixture():
     return ResponseHandler()
 
 
-@contextmanager
-def does_not_raise():
+# A context manager that does not raise an exception.
+does_not_raise = nullcontext
+
+
+def current_test_name() -> str:
     """
-    A context manager that does not raise an exception.
+    Return the name of the calling function.
+
+    Cheaper than ``inspect.stack()[0][3]``, which builds a FrameInfo
+    record (including source context) for every frame on the stack.
     """
-    yield
+    return sys._getframe(1).f_code.co_name  # pylint: disable=protected-access
 
 
 def configs_common(key: str) -> dict:
@@ -145,12 +177,23 @@ def configs_merged(key: str) -> dict:
     return data
 
 
+@lru_cache(maxsize=None)
+def _load_configs_want() -> dict:
+    """
+    Load the Want playbook configs fixture file once per session.
+    """
+    return load_fixture("configs_Want")
+
+
 def configs_want(key: str) -> dict:
     """
     Return playbook configs for Want
+
+    A copy is returned so that callers cannot modify the cached
+    fixture data.
     """
     data_file = "configs_Want"
-    data = load_fixture(data_file).get(key)
+    data = copy.deepcopy(_load_configs_want().get(key))
     print(f"{data_file}: {key} : {data}")
     return data
 